@@ -1,5 +1,10 @@
 from .main import (
     convert_time,
+    convert_time_batch,
+    make_converter,
+    seconds_per_tick,
+    seconds_per_beat,
+    seconds_per_measure,
     ticks_to_seconds,
     beats_to_seconds,
     timecode_to_seconds,
@@ -0,0 +1,37 @@
+"""
+Numba-compiled loop converting many ticks to frames in one pass, used by BPMtoFPS.main.convert_time_batch.
+
+This module imports Numba, which is slow to load. BPMtoFPS.main therefore never imports it at module level, and only
+uses the kernel when HAVE_NUMBA is true. The scalar functions in main stay plain Python, because calling a jitted
+function from the interpreter costs more than the few floating point operations it performs.
+"""
+import math
+
+try:
+    import numpy as np
+    from numba import njit, types
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional, convert_time_batch falls back to the NumPy expressions
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+    # The explicit signature compiles the kernel eagerly when this module is imported (or loads it from the on-disk
+    # cache), so the first batch pays no type inference. The kernel only reads the ticks, so the signature takes a
+    # read-only array. Writable arrays are accepted too, while read-only ones (np.frombuffer, memory maps, broadcast
+    # views) would not match a plain int64[:] signature.
+    _TICKS_ARRAY_SIGNATURES = [types.int64[:](types.Array(types.int64, 1, 'A', readonly=True),
+                                              types.float64, types.float64, types.float64)]
+
+    # Only worth compiling with Numba: as plain Python this loop would be far slower than the NumPy expressions. It
+    # runs serially, since a parallel loop can abort the whole process when called from several threads under
+    # Numba's workqueue threading layer, and the single fused pass already beats NumPy.
+    @njit(_TICKS_ARRAY_SIGNATURES, cache=True)
+    def ticks_to_frames_array(ticks, seconds_per_tick, fps, frac):
+        # Same operations in the same order as ticks_to_seconds followed by seconds_to_frames in main, fused into one
+        # pass with no temporary arrays
+        offset = 1.0 - frac
+        frames = np.empty(ticks.shape[0], dtype=np.int64)
+        for i in range(ticks.shape[0]):
+            frames[i] = math.floor(ticks[i] * seconds_per_tick * fps + offset)
+        return frames
@@ -1,28 +1,86 @@
 import math
-import argparse
-from typing import Union, Optional, Dict
+import operator
+import sys
+from functools import lru_cache
+from typing import Callable, Union, Optional, Dict
 
 TPB = 480  # Ticks per beat (resolution)
 SPM = 60  # Seconds per minute
 fraction = 0.75  # The threshold for rounding
 
+_FRAME_SUFFIXES = tuple(":%02d" % frame for frame in range(256))  # Timecode endings ":00" to ":255", by frame
+
+
+def _numpy_for(value):
+    """
+    Return the NumPy module if value is a NumPy array, otherwise None. NumPy is never imported here: if the caller
+    has an array, NumPy is already loaded, so library users who never pass arrays never pay for importing it.
+    """
+    np = sys.modules.get('numpy')
+    if np is not None and isinstance(value, np.ndarray):
+        return np
+    return None
+
+
+def seconds_per_tick(bpm: int, ticks_per_beat: int) -> float:
+    """
+    Length of one MIDI tick in seconds. Compute this once and multiply it by each tick value when converting
+    many values at the same tempo.
+
+    Parameters:
+        bpm (int): The beats per minute of the piece of music
+        ticks_per_beat (int): The number of ticks per quarter note
+
+    Returns:
+        Seconds per tick
+    """
+    return SPM / (ticks_per_beat * bpm)
+
+
+def seconds_per_beat(bpm: int) -> float:
+    """
+    Length of one beat in seconds
+
+    Parameters:
+        bpm (int): The beats per minute of the piece of music
+
+    Returns:
+        Seconds per beat
+    """
+    return SPM / bpm
+
+
+def seconds_per_measure(bpm: int, notes_per_measure: int) -> float:
+    """
+    Length of one measure in seconds
+
+    Parameters:
+        bpm (int): The beats per minute of the piece of music
+        notes_per_measure (int): The number of quarter notes per measure
+
+    Returns:
+        Seconds per measure
+    """
+    return notes_per_measure * SPM / bpm
+
 
 def ticks_to_seconds(input_value: int, bpm: int, ticks_per_beat: int) -> float:
     """
     Convert ticks to seconds
 
     Parameters:
-        input_value (int): The value to convert
+        input_value (int/np.ndarray): The value to convert, or an array of values
         bpm (int): The beats per minute of the piece of music
         ticks_per_beat (int): The number of ticks per quarter note (default is 480)
 
     Arithmetic:
-        seconds = input_value / ticks_per_beat / bpm * 60 seconds per minute
+        seconds = input_value * (60 seconds per minute / (ticks_per_beat * bpm))
 
     Returns:
          Total number of seconds
     """
-    return input_value / ticks_per_beat / bpm * SPM
+    # Plain arithmetic, so a NumPy array is converted in a single multiply as well
+    return input_value * (SPM / (ticks_per_beat * bpm))
 
 
 def beats_to_seconds(input_value: int, bpm: int) -> float:
@@ -30,16 +88,16 @@ def beats_to_seconds(input_value: int, bpm: int) -> float:
     Convert beats to seconds
 
     Parameters:
-        input_value (int): The value to convert
+        input_value (int/np.ndarray): The value to convert, or an array of values
         bpm (int): The beats per minute of the piece of music
 
     Arithmetic:
-        seconds = input_value / bpm * 60 seconds per minute
+        seconds = input_value * (60 seconds per minute / bpm)
 
     Returns:
         Total number of seconds
     """
-    return input_value / bpm * SPM
+    return input_value * (SPM / bpm)
 
 
 def measures_to_seconds(input_value: int, bpm: int, notes_per_measure: int) -> float:
@@ -47,25 +105,26 @@ def measures_to_seconds(input_value: int, bpm: int, notes_per_measure: int) -> f
     Convert measures to seconds
 
     Parameters:
-        input_value (int): The value to convert
+        input_value (int/np.ndarray): The value to convert, or an array of values
         bpm (int): The beats per minute of the piece of music
         notes_per_measure (int): The number of quarter notes per measure
 
     Arithmetic:
-        seconds = input_value * notes_per_measure / bpm * 60 seconds per minute
+        seconds = input_value * (notes_per_measure * 60 seconds per minute / bpm)
 
     Returns:
          Total number of seconds
     """
-    return input_value * notes_per_measure / bpm * SPM
+    return input_value * (notes_per_measure * SPM / bpm)
 
 
+@lru_cache(maxsize=4096)
 def timecode_to_seconds(input_value: str) -> float:
     """
-    Convert timecode to seconds
+    Convert timecode to seconds. Results are cached, as cue points and markers tend to repeat the same timecodes.
 
     Parameters:
-        input_value (int): The value to convert
+        input_value (str): The value to convert
 
     Arithmetic:
         seconds = minutes of timecode * 60 seconds per minute + seconds of timecode
@@ -73,11 +132,36 @@ def timecode_to_seconds(input_value: str) -> float:
     Returns:
         Total number of seconds
     """
-    if ':' in input_value:
-        minutes, seconds = map(float, input_value.split(':'))
-        return minutes * SPM + seconds
+    # A single partition scans the string once and avoids building a list and a map object
+    minutes, separator, seconds = input_value.partition(':')
+    if separator:
+        return float(minutes) * SPM + float(seconds)
     else:
-        return float(input_value)
+        return float(minutes)
+
+
+def _video_frames_to_seconds_raw(input_value: int, fps: float) -> float:
+    """Unrounded form of video_frames_to_seconds, used internally where the result is converted again"""
+    return input_value / fps
+
+
+def _round_near_half(np, seconds, cents):
+    """
+    Round seconds lying close to cents + 0.5 hundredths to two decimals the way round() does, by comparing the
+    exact value of each float with that half instead of its rounded product with 100
+
+    Arithmetic:
+        seconds * 200 - (2 * cents + 1), computed exactly by splitting seconds into two halves of its bits
+    """
+    split = seconds * 134217729.0  # 2 ** 27 + 1
+    high = split - (split - seconds)
+    low = seconds - high
+    # Each product below is exact, the subtraction is exact because its operands are within a factor of two, and the
+    # final addition keeps the sign of the exact sum
+    difference = (high * 200.0 - (2.0 * cents + 1.0)) + low * 200.0
+    # Above the half rounds up, below it rounds down, and an exact half rounds to even like round()
+    cents = cents + ((difference > 0) | ((difference == 0) & (cents % 2 == 1)))
+    return np.copysign(cents / 100.0, seconds)
 
 
 def video_frames_to_seconds(input_value: int, fps: float) -> float:
@@ -85,7 +169,7 @@ def video_frames_to_seconds(input_value: int, fps: float) -> float:
     Convert frames to seconds
 
     Parameters:
-        input_value (int): The value to convert
+        input_value (int/np.ndarray): The value to convert, or an array of values
         fps (float): The frames per second of the video
 
     Arithmetic:
@@ -94,6 +178,18 @@ def video_frames_to_seconds(input_value: int, fps: float) -> float:
     Returns:
         Total number of seconds as a float
     """
+    np = _numpy_for(input_value)
+    if np is not None:
+        # ndarray has no __round__, and np.round scales by 100 first, which can tip values lying within an ulp of a
+        # half across it. Those few elements are re-rounded the way round() does, so arrays match scalar results.
+        seconds = np.true_divide(input_value, fps, dtype=np.float64)
+        rounded = np.round(seconds, 2)
+        scaled = seconds * 100.0
+        near_half = ((np.abs(scaled - np.floor(scaled) - 0.5) <= 4.0 * np.spacing(np.abs(scaled))) &
+                     (np.abs(scaled) < 2.0 ** 52))
+        if near_half.any():
+            rounded[near_half] = _round_near_half(np, seconds[near_half], np.floor(scaled[near_half]))
+        return rounded
     return round(input_value / fps, 2)
 
 
@@ -102,24 +198,78 @@ def seconds_to_frames(seconds: float, fps: float, frac: Optional[float] = fracti
     Convert seconds to frames
 
     Parameters:
-        seconds (int): The number of seconds
+        seconds (int/np.ndarray): The number of seconds, or an array of seconds
         fps (int): The number of frames per second in a video project
         frac (float): The threshold for rounding
 
     Arithmetic:
-        frames = (seconds * fps) rounded depending on decimal vs. fraction
+        frames = floor(seconds * fps + (1 - fraction)), rounding up once the decimal reaches the fraction
 
     Returns:
         Total number of frames
     """
-    frame_count = seconds * fps
-    whole_frames = math.floor(frame_count)
-    fractional_frames = frame_count % 1
+    np = _numpy_for(seconds)
+    if np is not None:
+        frame_count = np.multiply(seconds, fps, dtype=np.float64)
+        frame_count += 1.0 - frac
+        return np.floor(frame_count, out=frame_count).astype(np.int64)
+
+    # Adding (1 - frac) before flooring rounds up exactly when the fractional part reaches frac, without a branch
+    return math.floor(seconds * fps + (1.0 - frac))
+
+
+def _format_timecode(whole_seconds, frame_part):
+    """Join the whole seconds and the frame within that second into a timecode string"""
+    # Looking up the padded frame suffix is quicker than formatting it, which covers every frame rate up to 255
+    if 0 <= frame_part < 256:
+        return str(whole_seconds) + _FRAME_SUFFIXES[frame_part]
+    return "%d:%02d" % (whole_seconds, frame_part)
+
+
+def _format_timecodes(whole_seconds, frame_parts):
+    """Array form of _format_timecode, returning a list of timecode strings"""
+    # tolist() hands back Python ints in one call, which the string formatting needs anyway
+    pairs = zip(whole_seconds.tolist(), frame_parts.tolist())
+    if frame_parts.size and (frame_parts.min() < 0 or frame_parts.max() >= 256):
+        return ["%d:%02d" % pair for pair in pairs]
+    return [str(whole) + _FRAME_SUFFIXES[part] for whole, part in pairs]
+
+
+def _frames_to_timecode(whole_frames, seconds, fps):
+    """Build the timecode for seconds from its frame count, already rounded by seconds_to_frames"""
+    np = _numpy_for(seconds)
+    if np is not None:
+        whole_seconds = np.floor(seconds).astype(np.int64)
+        frame_parts = (whole_frames - whole_seconds * fps).astype(np.int64)
+        # Rounding up can reach the first frame of the next second, carry it over like the scalar path
+        carry = frame_parts >= fps
+        if carry.any():
+            whole_seconds += carry
+            frame_parts = (whole_frames - whole_seconds * fps).astype(np.int64)
+        return _format_timecodes(whole_seconds, frame_parts)
 
-    if fractional_frames >= frac:
-        whole_frames += 1
+    whole_seconds = math.floor(seconds)
+    frame_part = int(whole_frames - whole_seconds * fps)
 
-    return whole_frames
+    # Rounding up can reach the first frame of the next second, which belongs to that second
+    if frame_part >= fps:
+        whole_seconds += 1
+        frame_part = int(whole_frames - whole_seconds * fps)
+    return _format_timecode(whole_seconds, frame_part)
+
+
+def _exact_frames_to_timecode(whole_frames, fps):
+    """
+    Build the timecode from a frame count at a whole-number frame rate, such as one counted by _exact_frames. The
+    count is split in integers, so no float seconds are involved.
+
+    Arithmetic:
+        timecode = string(whole frames // fps + ":" + whole frames % fps)
+    """
+    np = _numpy_for(whole_frames)
+    if np is not None:
+        return _format_timecodes(*np.divmod(whole_frames, fps))
+    return _format_timecode(*divmod(whole_frames, fps))
 
 
 def seconds_to_timecode(seconds: float, fps: float, frac: Optional[float] = fraction) -> str:
@@ -127,7 +277,7 @@ def seconds_to_timecode(seconds: float, fps: float, frac: Optional[float] = frac
     Convert seconds to timecode
 
     Parameters:
-        seconds (int): The number of seconds
+        seconds (int/np.ndarray): The number of seconds, or an array of seconds
         fps (int): The number of frames per second in a video project
         frac (float): The threshold for rounding
 
@@ -135,16 +285,163 @@ def seconds_to_timecode(seconds: float, fps: float, frac: Optional[float] = frac
         timecode = string(total frames + ":" + total frames - seconds * fps)
 
     Returns:
-        Timecode as string
+        Timecode as string, or a list of timecode strings for array input
     """
-    whole_frames = seconds_to_frames(seconds, fps, frac)
-    whole_seconds = math.floor(seconds)
-    frame_part = int(whole_frames - whole_seconds * fps)
+    if _numpy_for(seconds) is not None:
+        return _frames_to_timecode(seconds_to_frames(seconds, fps, frac), seconds, fps)
+    return _frames_to_timecode(math.floor(seconds * fps + (1.0 - frac)), seconds, fps)
+
+
+# Output conversions take the same arguments, so one module-level map serves every call
+_OUT_CONVERSION_MAP = {
+    'frames': seconds_to_frames,
+    'timecode': seconds_to_timecode
+}
+
+_IN_FORMATS = frozenset(('ticks', 'beats', 'measures', 'timecode', 'video_frames'))
+_OUT_FORMATS = frozenset(('frames', 'timecode', 'seconds'))
+
+
+def _validate_arguments(ref_format, target_formats, bpm, fps, ticks_per_beat, notes_per_measure) -> list:
+    """
+    Check the formats and required parameters once, before converting, so the conversion itself needs no exception
+    handling. Returns target_formats as a list.
+    """
+    if ref_format not in _IN_FORMATS:
+        raise ValueError(f"Unknown input format {ref_format!r}, expected one of: {', '.join(sorted(_IN_FORMATS))}")
+
+    # If the target_formats variable is not a list, make it a list. A list is used as given (it is never modified).
+    if isinstance(target_formats, tuple):
+        target_formats = list(target_formats)
+    elif not isinstance(target_formats, list):
+        target_formats = [target_formats]
+    for target_format in target_formats:
+        if target_format not in _OUT_FORMATS:
+            raise ValueError(f"Unknown output format {target_format!r}, expected one of: "
+                             f"{', '.join(sorted(_OUT_FORMATS))}")
+
+    if ref_format in ('ticks', 'beats', 'measures') and bpm is None:
+        raise ValueError(f"bpm is required when converting {ref_format}")
+    if ref_format == 'ticks' and ticks_per_beat is None:
+        raise ValueError("ticks_per_beat is required when converting ticks")
+    if ref_format == 'measures' and notes_per_measure is None:
+        raise ValueError("notes_per_measure is required when converting measures")
+    if fps is None and (ref_format == 'video_frames' or
+                        any(target_format != 'seconds' for target_format in target_formats)):
+        raise ValueError("fps is required when converting video frames or outputting frames or timecode")
+    if fps is not None and fps <= 0:
+        raise ValueError("fps must be greater than zero")
+
+    return target_formats
+
+
+def _to_seconds(ref_format, input_value, bpm, fps, ticks_per_beat, notes_per_measure):
+    """Convert a validated input value, or an array of them, to seconds"""
+    # Dispatch directly on the format instead of building a map of closures on every call
+    if ref_format == 'ticks':
+        return ticks_to_seconds(input_value, bpm, ticks_per_beat)
+    elif ref_format == 'beats':
+        return beats_to_seconds(input_value, bpm)
+    elif ref_format == 'measures':
+        return measures_to_seconds(input_value, bpm, notes_per_measure)
+    elif ref_format == 'timecode':
+        return timecode_to_seconds(input_value)
+    else:
+        # Keep full precision here, frames and timecode are rounded again on output
+        return _video_frames_to_seconds_raw(input_value, fps)
+
+
+def _whole_number(value):
+    """Return value as an int if it is an integer of any type (including NumPy's) or a whole float, otherwise None"""
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else None
+    try:
+        return operator.index(value)
+    except TypeError:
+        return None
+
+
+def _exact_frame_ratio(ref_format, bpm, fps, ticks_per_beat, notes_per_measure):
+    """
+    Return the video frames per tick, beat, or measure as an exact (numerator, denominator) pair of integers, or
+    None when the tempo or frame rate is not a whole number. Frames counted this way land exactly on the rounding
+    threshold instead of just below it, which float arithmetic can do.
+    """
+    if ref_format == 'ticks':
+        per_beat, multiplier = ticks_per_beat, 1
+    elif ref_format == 'beats':
+        per_beat, multiplier = 1, 1
+    elif ref_format == 'measures':
+        per_beat, multiplier = 1, notes_per_measure
+    else:
+        return None
+
+    # Judge the parameters by value, not type, so 42, 42.0 and numpy.int64(42) all count frames the same way
+    bpm, fps, per_beat, multiplier = (_whole_number(value) for value in (bpm, fps, per_beat, multiplier))
+    if bpm is None or fps is None or per_beat is None or multiplier is None:
+        return None
+    if bpm <= 0 or fps <= 0 or per_beat <= 0:
+        return None
+    return fps * SPM * multiplier, bpm * per_beat
+
+
+def _exact_frames(input_value, frame_ratio, frac):
+    """
+    Count the frames for an integer input value, or an integer array, from _exact_frame_ratio
+
+    Arithmetic:
+        frames = whole frames + (1 if leftover frames >= frac)
+    """
+    numerator, denominator = frame_ratio
+    scaled = input_value * numerator
+    whole_frames = scaled // denominator
+    return whole_frames + (scaled - whole_frames * denominator >= frac * denominator)
+
+
+def _from_seconds(seconds, target_formats, ref_format, input_value, fps, frame_ratio=None):
+    """
+    Build the output dictionary of convert_time and convert_time_batch from the converted seconds. Frames are
+    counted exactly from input_value when frame_ratio is given.
+    """
+    # If 'seconds' are indicated in target_formats, add the seconds to the dictionary first. The list may be the
+    # caller's own, so it is never modified, and 'seconds' is skipped in the loops below instead.
+    if 'seconds' in target_formats:
+        output = {'seconds': video_frames_to_seconds(input_value, fps) if ref_format == 'video_frames' else seconds}
+    else:
+        output = {}
 
-    return f"{whole_seconds}:{frame_part:02d}"
+    # Frames and timecode both start from the rounded frame count. It is computed once up front when it can be
+    # counted exactly, or when both formats are requested.
+    if frame_ratio is not None:
+        whole_frames = _exact_frames(input_value, frame_ratio, fraction)
+    elif ref_format != 'video_frames' and 'frames' in target_formats and 'timecode' in target_formats:
+        whole_frames = seconds_to_frames(seconds, fps, fraction)
+    else:
+        whole_frames = None
 
+    if whole_frames is not None:
+        for target_format in target_formats:
+            if target_format == 'frames':
+                output[target_format] = whole_frames
+            elif target_format == 'timecode':
+                output[target_format] = (_exact_frames_to_timecode(whole_frames, int(fps)) if frame_ratio is not None
+                                         else _frames_to_timecode(whole_frames, seconds, fps))
+        return output
 
-def convert_time(ref_format: str, target_formats: Union[str, list], input_value: Union[int, str],
+    # Now do the other target formats
+    for target_format in target_formats:
+        if target_format == 'seconds':
+            continue
+        # Frames to frames is an identity, skip the round trip through seconds
+        if target_format == 'frames' and ref_format == 'video_frames':
+            output[target_format] = input_value
+            continue
+        output[target_format] = _OUT_CONVERSION_MAP[target_format](seconds, fps, fraction)
+
+    return output
+
+
+def convert_time(ref_format: str, target_formats: Union[str, list, tuple], input_value: Union[int, str],
                  bpm: Optional[int] = None, fps: float = None, ticks_per_beat: int = TPB,
                  notes_per_measure: int = None, do_print: bool = False) -> Union[int, str, Dict]:
     """
@@ -153,8 +450,10 @@ def convert_time(ref_format: str, target_formats: Union[str, list], input_value:
 
     Required Parameters:
         - ref_format (string): The input of the function as either a number of ticks, beats, or timecode
-        - target_format (list): The output of the function as any combination of video frames, timecode, or seconds
-        - input_value (string/int): The number of ticks or the timecode to be processed, based on the input provided
+        - target_format (list/tuple): The output of the function as any combination of video frames, timecode, or
+          seconds
+        - input_value (string/int): The number of ticks or the timecode to be processed, based on the input provided.
+          A list, tuple, or NumPy array of values is converted in one pass by convert_time_batch (requires NumPy)
         - fps (float): The frames per second of the video project
 
     Optional Parameters:
@@ -166,61 +465,47 @@ def convert_time(ref_format: str, target_formats: Union[str, list], input_value:
     Returns:
         Depending on the target_format, this function returns either the number of frames in the video as an
         integer, the specific timecode in the video as string, and/or just the seconds as a float. All results
-        are returned in a dictionary.
+        are returned in a dictionary. For multiple input values, see convert_time_batch.
     """
 
-    # Do not allow floats under any circumstances. While timecode can have a float in seconds, it must be entered as
-    # string.
-    if isinstance(input_value, float):
-        raise ValueError("Input must be a string for timecodes or an integer for beats and ticks. Floats are not "
-                         "accepted.")
+    target_formats = _validate_arguments(ref_format, target_formats, bpm, fps, ticks_per_beat, notes_per_measure)
+
+    # Exact int and str inputs are by far the most common and need no checks, so test their type first
+    value_type = type(input_value)
+    if value_type is not int and value_type is not str:
+        # A list or array of values is handed to the vectorized batch path
+        if value_type is list or value_type is tuple or _numpy_for(input_value) is not None:
+            output = convert_time_batch(ref_format, target_formats, input_value, bpm, fps, ticks_per_beat,
+                                        notes_per_measure)
+            if do_print:
+                print(output)
+            return output
+
+        # Do not allow floats under any circumstances. While timecode can have a float in seconds, it must be entered
+        # as string.
+        if isinstance(input_value, float):
+            raise ValueError("Input must be a string for timecodes or an integer for beats and ticks. Floats are not "
+                             "accepted.")
 
     # Convert input value to integer if 'ticks' or 'beats' is specified.
-    if ref_format in ['ticks', 'beats', 'measures', 'video_frames']:
-        try:
-            input_value = int(input_value)
-        except ValueError:
-            raise ValueError("Input for ticks, beats, measures, and video_frames must be an integer.")
-    else:
+    if ref_format != 'timecode':
+        if value_type is not int:
+            try:
+                input_value = int(input_value)
+            except ValueError:
+                raise ValueError("Input for ticks, beats, measures, and video_frames must be an integer.")
+    elif value_type is not str:
         input_value = str(input_value)
     # No conversion needed here for timecode, but instead ensure that the value is passed through as string.
 
-    # Conversion maps to functions
-    in_conversion_map = {
-        'ticks': lambda x: ticks_to_seconds(x, bpm, ticks_per_beat),
-        'beats': lambda x: beats_to_seconds(x, bpm),
-        'measures': lambda x: measures_to_seconds(x, bpm, notes_per_measure),
-        'timecode': timecode_to_seconds,
-        'video_frames': lambda x: video_frames_to_seconds(x, fps)
-    }
-    out_conversion_map = {
-        'frames': seconds_to_frames,
-        'timecode': seconds_to_timecode
-    }
-
-    # Attempt conversion, using conversion maps to navigate to proper function
-    try:
-        seconds = in_conversion_map[ref_format](input_value)
-    except Exception as err:
-        raise ValueError(f"An error occurred during conversion: {err}")
-
-    # If the target_formats variable is not a list, make it a list
-    if not isinstance(target_formats, list):
-        target_formats = [target_formats]
+    seconds = _to_seconds(ref_format, input_value, bpm, fps, ticks_per_beat, notes_per_measure)
 
-    # If 'seconds' are indicated in target_formats, add the seconds to the dictionary first and remove it from the list
-    if 'seconds' in target_formats:
+    # Seconds alone need no frame arithmetic and no output loop
+    if target_formats == ['seconds'] and ref_format != 'video_frames':
         output = {'seconds': seconds}
-        target_formats.remove('seconds')
     else:
-        output = {}
-
-    # Now do the other target formats
-    for target_format in target_formats:
-        try:
-            output[target_format] = out_conversion_map[target_format](seconds, fps, fraction)
-        except Exception as err:
-            raise ValueError(f"An error occurred during conversion: {err}")
+        frame_ratio = _exact_frame_ratio(ref_format, bpm, fps, ticks_per_beat, notes_per_measure)
+        output = _from_seconds(seconds, target_formats, ref_format, input_value, fps, frame_ratio)
 
     # Print results if requested
     if do_print:
@@ -229,61 +514,167 @@ def convert_time(ref_format: str, target_formats: Union[str, list], input_value:
     return output
 
 
+def make_converter(ref_format: str, target_format: str, bpm: Optional[int] = None, fps: float = None,
+                   ticks_per_beat: int = TPB, notes_per_measure: int = None,
+                   frac: Optional[float] = fraction) -> Callable:
+    """
+    Build a converter specialized for one input format, one output format, and fixed timing parameters. All
+    validation, dispatch, and factor arithmetic happen once here, so the returned function only does the conversion
+    itself. Use it when converting many values in a loop with the same settings.
+
+    Required Parameters:
+        - ref_format (string): The input format, as in convert_time
+        - target_format (string): A single output format, either frames, timecode, or seconds
+        - fps (float): The frames per second of the video project
+
+    Optional Parameters:
+        - bpm (float): The beats per minute, not required if inputting timecode
+        - ticks_per_beat (int): The number of ticks per beat
+        - notes_per_measure (int): The number of quarter notes that make up a measure of music
+        - frac (float): The threshold for rounding
+
+    Returns:
+        A function taking one input value (an integer, or a string for timecode) and returning the converted value
+        itself, not a dictionary. Results are identical to convert_time with the same arguments.
+    """
+    if not isinstance(target_format, str):
+        raise ValueError("make_converter takes a single output format, not a list")
+    _validate_arguments(ref_format, target_format, bpm, fps, ticks_per_beat, notes_per_measure)
+    floor = math.floor
+    offset = 1.0 - frac
+
+    if ref_format == 'video_frames':
+        if target_format == 'frames':
+            return int
+        elif target_format == 'seconds':
+            return lambda value: round(value / fps, 2)
+        return lambda value: seconds_to_timecode(value / fps, fps, frac)
+
+    if ref_format == 'timecode':
+        if target_format == 'frames':
+            return lambda value: floor(timecode_to_seconds(value) * fps + offset)
+        elif target_format == 'seconds':
+            return timecode_to_seconds
+        return lambda value: seconds_to_timecode(timecode_to_seconds(value), fps, frac)
+
+    # Ticks, beats, and measures all reduce to a single multiply by the length of one unit
+    if ref_format == 'ticks':
+        factor = seconds_per_tick(bpm, ticks_per_beat)
+    elif ref_format == 'beats':
+        factor = seconds_per_beat(bpm)
+    else:
+        factor = seconds_per_measure(bpm, notes_per_measure)
+
+    frame_ratio = _exact_frame_ratio(ref_format, bpm, fps, ticks_per_beat, notes_per_measure)
+    if target_format == 'seconds':
+        return lambda value: value * factor
+    elif frame_ratio is not None:
+        if target_format == 'frames':
+            # Same arithmetic as _exact_frames, inlined to save a call per value
+            numerator, denominator = frame_ratio
+            threshold = frac * denominator
+
+            def to_frames(value):
+                whole_frames, leftover = divmod(value * numerator, denominator)
+                return whole_frames + (leftover >= threshold)
+            return to_frames
+        whole_fps = int(fps)
+        return lambda value: _exact_frames_to_timecode(_exact_frames(value, frame_ratio, frac), whole_fps)
+    elif target_format == 'frames':
+        return lambda value: floor(value * factor * fps + offset)
+    return lambda value: seconds_to_timecode(value * factor, fps, frac)
+
+
+@lru_cache(maxsize=1)
+def _numba_kernels():
+    """Import and return BPMtoFPS._kernels if Numba is installed, otherwise None. Importing Numba is slow, so this
+    is only done on the first batch conversion that can use it."""
+    from . import _kernels
+    return _kernels if _kernels.HAVE_NUMBA else None
+
+
+def convert_time_batch(ref_format: str, target_formats: Union[str, list, tuple], input_values,
+                       bpm: Optional[int] = None, fps: float = None, ticks_per_beat: int = TPB,
+                       notes_per_measure: int = None) -> Dict:
+    """
+    Convert many values at once. Takes the same parameters as convert_time, but input_values is a list or NumPy
+    array of values, all converted in one vectorized pass. Requires NumPy. If Numba is also installed, ticks converted
+    to frames alone run in one compiled loop (the first such call pays the Numba import).
+
+    Required Parameters:
+        - ref_format (string): The input of the function as either a number of ticks, beats, or timecode
+        - target_format (list/tuple): The output of the function as any combination of video frames, timecode, or
+          seconds
+        - input_values (list/np.ndarray): The numbers of ticks or the timecodes to be processed
+        - fps (float): The frames per second of the video project
+
+    Optional Parameters:
+        - bpm (float): The beats per minute, not required if inputting timecode
+        - ticks_per_beat (int): The number of ticks per beat
+        - notes_per_measure (int): The number of quarter notes that make up a measure of music
+
+    Returns:
+        A dictionary like convert_time, holding an integer array of frames, a list of timecode strings, and/or a
+        float array of seconds.
+    """
+    import numpy as np
+
+    target_formats = _validate_arguments(ref_format, target_formats, bpm, fps, ticks_per_beat, notes_per_measure)
+    if np.ndim(input_values) != 1:
+        raise ValueError("input_values must be a flat list or one-dimensional array.")
+
+    if ref_format == 'timecode':
+        # Timecodes are strings, so each one is parsed (and cached) on its own before the vectorized outputs. As in
+        # convert_time, a float is refused rather than read as seconds.
+        if (getattr(input_values, 'dtype', None) is not None and input_values.dtype.kind == 'f') or \
+                any(isinstance(value, (float, np.floating)) for value in input_values):
+            raise ValueError("Input must be a string for timecodes or an integer for beats and ticks. Floats are not "
+                             "accepted.")
+        values = [str(value) for value in input_values]
+        seconds = np.fromiter(map(timecode_to_seconds, values), dtype=np.float64, count=len(values))
+        return _from_seconds(seconds, target_formats, ref_format, values, fps)
+
+    # Same rules as convert_time: integers only, floats are not accepted
+    values = np.asarray(input_values)
+    # NumPy gives an empty list the float64 dtype, but it holds no floats to reject
+    if values.size == 0:
+        values = values.astype(np.int64)
+    if values.dtype.kind == 'f':
+        raise ValueError("Input must be a string for timecodes or an integer for beats and ticks. Floats are not "
+                         "accepted.")
+    try:
+        values = values.astype(np.int64, copy=False)
+    except ValueError:
+        raise ValueError("Input for ticks, beats, measures, and video_frames must be an integer.")
+
+    # Frames are counted exactly in int64 as long as the scaled values cannot overflow
+    frame_ratio = _exact_frame_ratio(ref_format, bpm, fps, ticks_per_beat, notes_per_measure)
+    if frame_ratio is not None and values.size:
+        limit = np.iinfo(np.int64).max // frame_ratio[0]
+        if values.max() > limit or values.min() < -limit:
+            frame_ratio = None
+
+    # Ticks to frames alone is the common bulk case, and Numba can fuse it into a single loop
+    if ref_format == 'ticks' and target_formats == ['frames'] and frame_ratio is None:
+        kernels = _numba_kernels()
+        if kernels is not None:
+            return {'frames': kernels.ticks_to_frames_array(values, seconds_per_tick(bpm, ticks_per_beat), fps,
+                                                            fraction)}
+
+    seconds = _to_seconds(ref_format, values, bpm, fps, ticks_per_beat, notes_per_measure)
+    if ref_format == 'video_frames' and 'frames' in target_formats:
+        # Frames pass straight through to the output, and values may still be the caller's own array
+        values = values.copy()
+    return _from_seconds(seconds, target_formats, ref_format, values, fps, frame_ratio)
+
+
 if __name__ == '__main__':
-    parser = argparse.ArgumentParser(description='Convert MIDI ticks, beats, measures, or audio timecode '
-                                                 'to video frames, timecode, or seconds')
-
-    # Group all input types together so only one can be selected
-    input_group = parser.add_mutually_exclusive_group(required=True)
-    input_group.add_argument('-t', '--ticks', dest='input_type', action='store_const', const='ticks',
-                             help='Input is MIDI ticks')
-    input_group.add_argument('-b', '--beats', dest='input_type', action='store_const', const='beats',
-                             help='Input is beats')
-    input_group.add_argument('-m', '--measures', dest='input_type', action='store_const', const='measures',
-                             help='Input is measures')
-    input_group.add_argument('-c', '--timecode_in', dest='input_type', action='store_const', const='timecode',
-                             help='Input is timecode in mm:ss.sss format')
-    input_group.add_argument('-v', '--video_frames', dest='input_type', action='store_const', const='video_frames',
-                             help='Input is video frame number')
-
-    # Group all output types together so any combination is accepted
-    parser.add_argument('-V', '--frames', dest='output_types', action='append_const', const='frames',
-                        help='Output as frames')
-    parser.add_argument('-C', '--timecode_out', dest='output_types', action='append_const', const='timecode',
-                        help='Output as timecode')
-    parser.add_argument('-S', '--seconds', dest='output_types', action='append_const', const='seconds',
-                        help='Output as seconds')
-
-    # Additional parameters, requirement based on input type
-    parser.add_argument('-i', '--input_value', type=str, required=True,
-                        help='Input value (number of ticks, beats, or timecode)')
-    parser.add_argument('-B', '--bpm', type=int,
-                        help='Beats per minute, required when inputting ticks, beats, and measures')
-    parser.add_argument('-F', '--fps', type=float, required=True,
-                        help='Frames per second of the video, required for all input types')
-    parser.add_argument('-D', '--division', type=int, default=TPB,
-                        help='Number of MIDI ticks per beat (division), default is 480, required for ticks')
-    parser.add_argument('-N', '--notes_per_measure', type=int,
-                        help='Number of quarter notes that make a measure of music, required for measures')
-
-    # Optional parameters
-    parser.add_argument('-p', '--print', action='store_true',
-                        help='Print the output to the console')
-
-    args = parser.parse_args()
-
-    # Since BPM is not required for timecode, catch errors if it's not supplied for other inputs
-    if args.input_type == 'ticks' and (args.bpm is None or args.division is None):
-        parser.error("-B/--bpm and -D/--division is required when 'ticks' is the input type")
-    elif args.input_type == 'beats' and args.bpm is None:
-        parser.error("-B/--bpm is required when 'beats' is the input type")
-    elif args.input_type == 'measures' and (args.bpm is None or args.notes_per_measure is None):
-        parser.error("-B/--bpm and -N/--notes_per_measure is required when 'measures' is the input type")
-    elif args.input_type == 'video_frames' and args.fps is None:
-        parser.error("-F/--fps is required when 'video_frames' is the input type")
-
-    if args.output_types is None:
-        parser.error("At least one output type must be specified using -F/--frames, -C/--timecode_out, or -S/--seconds")
-
-    convert_time(args.input_type, args.output_types, args.input_value, args.bpm, args.fps, args.division,
-                 args.notes_per_measure, args.print)
+    # The command-line interface lives in BPMtoFPS/__main__.py. Running this file directly from inside the package
+    # folder leaves the package itself off the path, so add the folder above it first.
+    try:
+        from BPMtoFPS.__main__ import main
+    except ImportError:
+        import os
+        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        from BPMtoFPS.__main__ import main
+    main()
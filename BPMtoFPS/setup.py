@@ -9,7 +9,7 @@ setup(
     description="Convert time in a musical composition to time in a video production.",
     entry_points={
         'console_scripts': [
-            'convert_time=BPMtoFPS.main:convert_time',
+            'convert_time=BPMtoFPS.__main__:main',
         ],
     },
     long_description=open('README.md').read(),
@@ -23,6 +23,10 @@ setup(
     ],
     python_requires='>=3.6',
     install_requires=[],
+    extras_require={
+        'numpy': ['numpy'],
+        'numba': ['numba'],
+    },
     include_package_data=True,
     zip_safe=False
 )
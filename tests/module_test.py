@@ -3,11 +3,14 @@ from BPMtoFPS.main import (
     ticks_to_seconds,
     beats_to_seconds,
     measures_to_seconds,
+    seconds_per_tick,
     timecode_to_seconds,
     video_frames_to_seconds,
     seconds_to_frames,
     seconds_to_timecode,
-    convert_time
+    convert_time,
+    convert_time_batch,
+    make_converter
 )
 
 
@@ -15,6 +18,10 @@ def test_ticks_to_seconds():
     assert ticks_to_seconds(480, 120, 480) == 0.5
 
 
+def test_seconds_per_tick():
+    assert seconds_per_tick(120, 480) * 960 == ticks_to_seconds(960, 120, 480) == 1.0
+
+
 def test_beats_to_timecode():
     assert beats_to_seconds(24, 192) == 7.5
 
@@ -35,8 +42,18 @@ def test_seconds_to_frames():
     assert seconds_to_frames(44.4, 29.97, frac=0.65) == 1331
 
 
+def test_seconds_to_frames_threshold():
+    assert seconds_to_frames(1, 29.75) == 30
+    assert seconds_to_frames(1, 29.74) == 29
+
+
 def test_seconds_to_timecode():
     assert seconds_to_timecode(27.567, 29.97) == "27:16"
+    assert seconds_to_timecode(1.09, 30) == "1:02"
+    assert seconds_to_timecode(1.5, 1000) == "1:500"
+    # Rounding up into the next second carries over instead of giving "0:30"
+    assert seconds_to_timecode(0.995, 30) == "1:00"
+    assert seconds_to_timecode(0.995, 29.97) == "1:00"
 
 
 def test_seconds_to_seconds():
@@ -59,3 +76,206 @@ def test_convert_time_ticks_frames_timecode():
 def test_convert_time_timecode_frames_timecode_seconds():
     assert convert_time('timecode', ['frames', 'timecode', 'seconds'], '0:45.59',
                         fps=29.97) == {'frames': 1366, 'timecode': '45:17', 'seconds': 45.59}
+
+
+def test_ticks_to_seconds_array():
+    np = pytest.importorskip("numpy")
+    result = ticks_to_seconds(np.array([480, 960, 240]), 120, 480)
+    assert result.tolist() == [0.5, 1.0, 0.25]
+
+
+def test_seconds_to_frames_array():
+    np = pytest.importorskip("numpy")
+    seconds = [44.4, 27.567, 3.73]
+    result = seconds_to_frames(np.array(seconds), 29.97, frac=0.65)
+    assert result.tolist() == [seconds_to_frames(s, 29.97, frac=0.65) for s in seconds]
+
+
+def test_seconds_to_timecode_array():
+    np = pytest.importorskip("numpy")
+    seconds = [27.567, 7.5, 45.59, 0.0]
+    assert seconds_to_timecode(np.array(seconds), 29.97) == [seconds_to_timecode(s, 29.97) for s in seconds]
+    assert seconds_to_timecode(np.array(seconds), 1000) == [seconds_to_timecode(s, 1000) for s in seconds]
+    assert seconds_to_timecode(np.array([0.995, 1.5]), 30) == ["1:00", "1:15"]
+
+
+def test_video_frames_to_seconds_array():
+    np = pytest.importorskip("numpy")
+    assert video_frames_to_seconds(np.array([112, 30]), 30).tolist() == [3.73, 1.0]
+    # Halves must round like the scalar round(), e.g. frame 63582 at 240 fps is 264.93, not 264.92
+    frames = np.arange(100000)
+    assert video_frames_to_seconds(frames, 240).tolist() == [video_frames_to_seconds(f, 240) for f in range(100000)]
+    assert video_frames_to_seconds(-frames, 24).tolist() == [video_frames_to_seconds(-f, 24) for f in range(100000)]
+    halves = [0.125, 0.375, 2.675, 1.005, 1.015]
+    assert video_frames_to_seconds(np.array(halves), 1).tolist() == [round(s, 2) for s in halves]
+    assert convert_time_batch('video_frames', 'seconds', [63582], fps=240)['seconds'].tolist() == [264.93]
+
+
+def test_convert_time_batch():
+    pytest.importorskip("numpy")
+    result = convert_time_batch('ticks', ['frames', 'timecode', 'seconds'], [240, 3840], 192, 29.97)
+    assert result['frames'].tolist() == [4, 75]
+    assert result['timecode'] == ['0:04', '2:15']
+    assert result['seconds'].tolist() == [0.15625, 2.5]
+
+
+def test_convert_time_batch_numba():
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("numba")
+    # 29.97 fps has no exact frame count, so ticks to frames alone goes through the Numba kernel
+    ticks = range(0, 200000, 37)
+    result = convert_time_batch('ticks', 'frames', np.array(ticks), 192, 29.97)
+    assert result['frames'].tolist() == [convert_time('ticks', 'frames', t, 192, 29.97)['frames'] for t in ticks]
+    # Read-only arrays, like those from np.frombuffer or memory maps, go through the same kernel
+    read_only = np.array(ticks)
+    read_only.setflags(write=False)
+    assert convert_time_batch('ticks', 'frames', read_only, 192, 29.97)['frames'].tolist() == result['frames'].tolist()
+    broadcast = np.broadcast_to(np.int64(3840), (3,))
+    assert convert_time_batch('ticks', 'frames', broadcast, 192, 29.97)['frames'].tolist() == [75, 75, 75]
+
+
+def test_convert_time_batch_one_dimensional():
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ValueError, match="one-dimensional"):
+        convert_time_batch('ticks', 'frames', np.array([[240, 3840]]), 192, 29.97)
+    with pytest.raises(ValueError, match="one-dimensional"):
+        convert_time_batch('timecode', 'frames', [['0:45.59']], fps=29.97)
+
+
+def test_convert_time_batch_empty():
+    pytest.importorskip("numpy")
+    result = convert_time_batch('ticks', ['frames', 'timecode', 'seconds'], [], 192, 29.97)
+    assert result['frames'].tolist() == [] and result['frames'].dtype.kind == 'i'
+    assert result['timecode'] == []
+    assert result['seconds'].tolist() == []
+    assert convert_time('ticks', 'frames', [], 192, 29.97)['frames'].tolist() == []
+
+
+def test_convert_time_batch_timecode():
+    pytest.importorskip("numpy")
+    result = convert_time_batch('timecode', ['frames', 'timecode'], ['0:45.59', '27.567'], fps=29.97)
+    assert result['frames'].tolist() == [1366, 826]
+    assert result['timecode'] == ['45:17', '27:16']
+
+
+def test_convert_time_batch_timecode_floats():
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ValueError, match="Floats are not accepted"):
+        convert_time('timecode', 'frames', [45.59], fps=29.97)
+    with pytest.raises(ValueError, match="Floats are not accepted"):
+        convert_time_batch('timecode', 'frames', ['0:45.59', np.float32(27.5)], fps=29.97)
+    with pytest.raises(ValueError, match="Floats are not accepted"):
+        convert_time_batch('timecode', 'frames', np.array([45.59]), fps=29.97)
+
+
+def test_convert_time_missing_bpm():
+    with pytest.raises(ValueError, match="bpm is required"):
+        convert_time('beats', 'frames', 24, fps=29.97)
+
+
+def test_convert_time_unknown_format():
+    with pytest.raises(ValueError, match="Unknown output format"):
+        convert_time('beats', 'tempo', 24, 192, 29.97)
+
+
+def test_convert_time_video_frames_to_frames():
+    assert convert_time('video_frames', 'frames', 1331, fps=29.97) == {'frames': 1331}
+
+
+def test_convert_time_video_frames_round_trip():
+    assert convert_time('video_frames', ['frames', 'seconds'], 1002, fps=240) == {'seconds': 4.17, 'frames': 1002}
+
+
+def test_convert_time_batch_video_frames_copy():
+    np = pytest.importorskip("numpy")
+    frames = np.array([1331, 1002])
+    result = convert_time_batch('video_frames', ['frames', 'seconds'], frames, fps=29.97)
+    assert result['frames'] is not frames
+    result['frames'][0] = 0
+    assert frames.tolist() == [1331, 1002]
+
+
+def test_make_converter():
+    to_frames = make_converter('ticks', 'frames', 192, 29.97)
+    assert [to_frames(value) for value in (240, 3840)] == [4, 75]
+    to_timecode = make_converter('timecode', 'timecode', fps=29.97)
+    assert to_timecode('0:45.59') == convert_time('timecode', 'timecode', '0:45.59', fps=29.97)['timecode']
+    to_seconds = make_converter('measures', 'seconds', 138, notes_per_measure=4)
+    assert to_seconds(8) == convert_time('measures', 'seconds', 8, 138, notes_per_measure=4)['seconds']
+    with pytest.raises(ValueError):
+        make_converter('ticks', ['frames', 'timecode'], 192, 29.97)
+
+
+def test_convert_time_input_types():
+    assert convert_time('ticks', 'frames', '3840', 192, 29.97) == convert_time('ticks', 'frames', 3840, 192, 29.97)
+    with pytest.raises(ValueError, match="Floats are not accepted"):
+        convert_time('ticks', 'frames', 3840.0, 192, 29.97)
+    with pytest.raises(ValueError, match="Floats are not accepted"):
+        convert_time('timecode', 'frames', 45.59, fps=29.97)
+
+
+def test_convert_time_list_input():
+    pytest.importorskip("numpy")
+    result = convert_time('ticks', ['frames', 'timecode'], [240, 3840], 192, 29.97)
+    assert result['frames'].tolist() == [4, 75]
+    assert result['timecode'] == ['0:04', '2:15']
+
+
+def test_convert_time_keeps_target_formats():
+    target_formats = ['seconds', 'frames', 'timecode']
+    convert_time('ticks', target_formats, 3840, 192, 29.97)
+    convert_time('ticks', target_formats, 3840, 192, 29.97)
+    assert target_formats == ['seconds', 'frames', 'timecode']
+    assert convert_time('ticks', ('seconds', 'frames'), 3840, 192, 29.97) == {'seconds': 2.5, 'frames': 75}
+
+
+def test_exact_frames_integer_fps():
+    # 8386 ticks at 96 ticks per beat and 42 bpm is exactly 3743.75 frames at 30 fps, right on the threshold
+    assert convert_time('ticks', ['frames', 'timecode'], 8386, 42, 30, 96) == {'frames': 3744, 'timecode': '124:24'}
+    assert make_converter('ticks', 'frames', 42, 30.0, 96)(8386) == 3744
+    # The tempo is judged by value, so a float or NumPy bpm takes the same exact path
+    assert convert_time('ticks', 'frames', 8386, 42.0, 30, 96) == {'frames': 3744}
+    assert make_converter('ticks', 'frames', 42.0, 30, 96.0)(8386) == 3744
+
+
+def test_exact_frames_timecode():
+    # Far past the precision of float seconds, the timecode still splits the exact frame count
+    ticks = 3 * 10 ** 17 + 7
+    frames = convert_time('ticks', 'frames', ticks, 42, 30, 96)['frames']
+    expected = "%d:%02d" % divmod(frames, 30)
+    assert convert_time('ticks', 'timecode', ticks, 42, 30, 96) == {'timecode': expected}
+    assert make_converter('ticks', 'timecode', 42, 30, 96)(ticks) == expected
+
+
+def test_frames_to_timecode_out_of_range_frame():
+    from BPMtoFPS.main import _frames_to_timecode
+    # A frame part outside the suffix table is formatted instead of wrapping around to another suffix
+    assert _frames_to_timecode(0, 1.0, 30) == "1:-30"
+
+
+def test_convert_time_non_positive_fps():
+    with pytest.raises(ValueError, match="fps must be greater than zero"):
+        convert_time('ticks', 'timecode', 4, 120, 0, 480)
+    with pytest.raises(ValueError, match="fps must be greater than zero"):
+        make_converter('ticks', 'frames', 120, -30)
+
+
+def test_exact_frames_numpy_scalars():
+    np = pytest.importorskip("numpy")
+    assert convert_time('ticks', 'frames', 8386, np.int64(42), np.float64(30), np.int32(96)) == {'frames': 3744}
+    assert convert_time_batch('ticks', 'frames', [8386], np.int64(42), 30, 96)['frames'].tolist() == [3744]
+
+
+def test_exact_frames_batch():
+    np = pytest.importorskip("numpy")
+    assert convert_time_batch('ticks', 'frames', [8386, 480], 42, 30, 96)['frames'].tolist() == [3744, 214]
+    assert convert_time_batch('ticks', 'timecode', [8386, -480], 42, 30, 96)['timecode'] == ['124:24', '-8:25']
+    with pytest.raises(ValueError, match="fps must be greater than zero"):
+        convert_time_batch('ticks', 'frames', np.array([4]), 120, 0)
+
+
+def test_command_line(monkeypatch, capsys):
+    from BPMtoFPS.__main__ import main
+    monkeypatch.setattr('sys.argv', ['convert_time', '-tVCp', '-i', '3840', '-B', '192', '-F', '29.97'])
+    main()
+    assert capsys.readouterr().out.strip() == "{'frames': 75, 'timecode': '2:15'}"